@@ -0,0 +1,93 @@
+"""
+Uniform grid over the Y/Z coordinates of a point set for bounded nearest searches.
+Mirror matching flips X and compares positions within a small tolerance, so
+bucketing targets by (Y, Z) cell and probing the 3x3 block of cells around each
+query finds every candidate with a handful of NumPy array operations.
+"""
+
+import numpy as np
+
+class UniformGrid:
+    """Uniform 2D grid over the Y/Z coordinates of a fixed set of 3D points
+    
+    Cells are stored CSR style: point indices sorted by cell key plus binary
+    searches into the sorted keys, so no per-cell Python objects are created.
+    """
+    def __init__(self, points, cell_size):
+        self.points = np.ascontiguousarray(points, dtype=np.float32).reshape(-1, 3)
+        self.cell_size = float(cell_size)
+        
+        # Offset the origin by one cell so an empty ring of cells surrounds the points
+        yz = self.points[:, 1:]
+        self.origin = yz.min(axis=0) - self.cell_size if len(yz) else np.zeros(2, dtype=np.float32)
+        cells = self._cells(yz)
+        self.max_row = int(cells[:, 0].max()) + 1 if len(cells) else 1
+        self.stride = int(cells[:, 1].max()) + 2 if len(cells) else 2
+        
+        keys = cells[:, 0] * self.stride + cells[:, 1]
+        self.order = np.argsort(keys, kind='stable')
+        self.sorted_keys = keys[self.order]
+    
+    def _cells(self, yz):
+        """Integer (row, column) cell coordinates for an array of Y/Z positions"""
+        return np.floor((yz - self.origin) / self.cell_size).astype(np.int64)
+    
+    def query(self, query_points, max_dist=None):
+        """Find the nearest point to every query point within max_dist
+           max_dist defaults to (and must not exceed) the cell size
+           Returns (distances, indices) with inf / -1 where no point was found
+        """
+        if max_dist is None:
+            max_dist = self.cell_size
+        query_points = np.ascontiguousarray(query_points, dtype=np.float32).reshape(-1, 3)
+        query_count = len(query_points)
+        distances = np.full(query_count, np.inf)
+        indices = np.full(query_count, -1, dtype=np.int64)
+        if query_count == 0 or len(self.points) == 0:
+            return distances, indices
+        
+        cells = self._cells(query_points[:, 1:])
+        candidate_queries = []
+        candidate_points = []
+        
+        # Any point within max_dist lies in the query's cell or one of its 8 neighbours
+        for row_offset in (-1, 0, 1):
+            rows = np.clip(cells[:, 0] + row_offset, 0, self.max_row)
+            for col_offset in (-1, 0, 1):
+                cols = np.clip(cells[:, 1] + col_offset, 0, self.stride - 1)
+                keys = rows * self.stride + cols
+                starts = np.searchsorted(self.sorted_keys, keys, side='left')
+                counts = np.searchsorted(self.sorted_keys, keys, side='right') - starts
+                total = int(counts.sum())
+                if total == 0:
+                    continue
+                
+                # Expand every (query, cell) pair into one row per point in that cell
+                offsets = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+                candidate_queries.append(np.repeat(np.arange(query_count), counts))
+                candidate_points.append(self.order[np.repeat(starts, counts) + offsets])
+        
+        if not candidate_queries:
+            return distances, indices
+        
+        candidate_queries = np.concatenate(candidate_queries)
+        candidate_points = np.concatenate(candidate_points)
+        diff = self.points[candidate_points] - query_points[candidate_queries]
+        dists2 = np.einsum('ij,ij->i', diff, diff)
+        
+        # Drop candidates outside the search radius
+        within = dists2 <= max_dist * max_dist
+        candidate_queries = candidate_queries[within]
+        candidate_points = candidate_points[within]
+        dists2 = dists2[within]
+        
+        # Keep the closest candidate per query: sort by (query, distance) and take the first of each run
+        ranked = np.lexsort((dists2, candidate_queries))
+        candidate_queries = candidate_queries[ranked]
+        first = np.ones(len(ranked), dtype=bool)
+        first[1:] = candidate_queries[1:] != candidate_queries[:-1]
+        
+        best_queries = candidate_queries[first]
+        distances[best_queries] = np.sqrt(dists2[ranked][first])
+        indices[best_queries] = candidate_points[ranked][first]
+        return distances, indices
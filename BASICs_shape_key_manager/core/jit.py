@@ -0,0 +1,18 @@
+"""
+Optional Numba support for the core spatial helpers.
+Numba is not bundled with Blender, so when it is missing the decorators below
+return the functions unchanged and HAS_NUMBA lets callers pick another path.
+"""
+
+try:
+    from numba import njit, prange
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
@@ -0,0 +1,142 @@
+"""
+Flat-array KD-tree for nearest vertex searches when SciPy is not available.
+The tree is stored as a permutation of the input points (median of each range
+at its middle), so building and querying only touch contiguous NumPy arrays
+and compile cleanly with Numba.
+"""
+
+import numpy as np
+from .jit import njit
+
+# Large finite stand-in for an unbounded search radius (fastmath assumes no infinities)
+_UNBOUNDED = 1.0e300
+
+@njit(cache=True)
+def _build_kdtree(points):
+    """Order point indices so every range [lo, hi) has its median along the split axis at the middle"""
+    count = points.shape[0]
+    order = np.arange(count).astype(np.int32)
+    
+    # Explicit stack of (lo, hi, depth) ranges instead of recursion
+    stack = np.empty((128, 3), dtype=np.int64)
+    stack[0, 0] = 0
+    stack[0, 1] = count
+    stack[0, 2] = 0
+    top = 1
+    
+    while top > 0:
+        top -= 1
+        lo = stack[top, 0]
+        hi = stack[top, 1]
+        depth = stack[top, 2]
+        if hi - lo < 2:
+            continue
+        
+        # Partition this range around its median along the split axis (cycling X, Y, Z),
+        # the halves only need to be on the correct side, not sorted
+        axis = depth % 3
+        mid = (lo + hi) // 2
+        indices = order[lo:hi].copy()
+        keys = np.empty(hi - lo, dtype=points.dtype)
+        for i in range(hi - lo):
+            keys[i] = points[indices[i], axis]
+        order[lo:hi] = indices[np.argpartition(keys, mid - lo)]
+        
+        # Recurse into both halves around the median
+        stack[top, 0] = lo
+        stack[top, 1] = mid
+        stack[top, 2] = depth + 1
+        stack[top + 1, 0] = mid + 1
+        stack[top + 1, 1] = hi
+        stack[top + 1, 2] = depth + 1
+        top += 2
+    
+    return order
+
+@njit(cache=True, fastmath=True)
+def _query_kdtree(points, order, query_points, max_dist2):
+    """Find the nearest point within max_dist2 (squared) for every query point"""
+    query_count = query_points.shape[0]
+    best_dists = np.full(query_count, max_dist2)
+    best_indices = np.full(query_count, -1, dtype=np.int64)
+    
+    # Stack of (lo, hi, depth) ranges plus the squared distance to each range's splitting plane
+    stack = np.empty((128, 3), dtype=np.int64)
+    bounds = np.empty(128, dtype=np.float64)
+    
+    for q in range(query_count):
+        qx = query_points[q, 0]
+        qy = query_points[q, 1]
+        qz = query_points[q, 2]
+        best = max_dist2
+        best_idx = -1
+        
+        stack[0, 0] = 0
+        stack[0, 1] = order.shape[0]
+        stack[0, 2] = 0
+        bounds[0] = 0.0
+        top = 1
+        
+        while top > 0:
+            top -= 1
+            # Skip ranges whose splitting plane is already farther than the best match
+            if bounds[top] > best:
+                continue
+            lo = stack[top, 0]
+            hi = stack[top, 1]
+            depth = stack[top, 2]
+            if lo >= hi:
+                continue
+            
+            mid = (lo + hi) // 2
+            idx = order[mid]
+            dx = qx - points[idx, 0]
+            dy = qy - points[idx, 1]
+            dz = qz - points[idx, 2]
+            dist = dx * dx + dy * dy + dz * dz
+            if dist < best or (best_idx < 0 and dist <= best):
+                best = dist
+                best_idx = idx
+            
+            axis = depth % 3
+            diff = dx if axis == 0 else (dy if axis == 1 else dz)
+            
+            # Push the far side first so the near side is searched first
+            if diff < 0:
+                near_lo, near_hi, far_lo, far_hi = lo, mid, mid + 1, hi
+            else:
+                near_lo, near_hi, far_lo, far_hi = mid + 1, hi, lo, mid
+            stack[top, 0] = far_lo
+            stack[top, 1] = far_hi
+            stack[top, 2] = depth + 1
+            bounds[top] = diff * diff
+            stack[top + 1, 0] = near_lo
+            stack[top + 1, 1] = near_hi
+            stack[top + 1, 2] = depth + 1
+            bounds[top + 1] = 0.0
+            top += 2
+        
+        best_dists[q] = best
+        best_indices[q] = best_idx
+    
+    return best_dists, best_indices
+
+class KDTree:
+    """Balanced KD-tree over a fixed set of 3D points"""
+    def __init__(self, points):
+        self.points = np.ascontiguousarray(points, dtype=np.float32)
+        self.order = _build_kdtree(self.points)
+    
+    def query(self, query_points, max_dist=float('inf')):
+        """Find the nearest point to every query point within max_dist
+           Returns (distances, indices) with inf / -1 where no point was found
+        """
+        query_points = np.ascontiguousarray(query_points, dtype=np.float32).reshape(-1, 3)
+        max_dist2 = max_dist * max_dist if np.isfinite(max_dist) else _UNBOUNDED
+        
+        dists2, indices = _query_kdtree(self.points, self.order, query_points, max_dist2)
+        
+        found = indices >= 0
+        distances = np.full(len(indices), np.inf)
+        distances[found] = np.sqrt(dists2[found])
+        return distances, indices
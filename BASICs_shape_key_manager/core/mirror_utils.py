@@ -4,236 +4,396 @@ These functions provide common functionality for vertex classification and mappi
 """
 
 import re
-from mathutils import Vector
-from . import Octree
+import hashlib
+import functools
+import numpy as np
+from .jit import HAS_NUMBA, njit, prange
+from .kdtree import KDTree
+from .grid import UniformGrid
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    # SciPy is not bundled with every Blender build, fall back to the Numba KDTree or the UniformGrid
+    cKDTree = None
+
+# Recent mirror matches, keyed by a digest of the coordinates, side partition and tolerance
+_match_cache = {}
+_MATCH_CACHE_SIZE = 16
+
+# Offsets of the snapping grids tried by the exact pass, the unshifted grid first
+_HALF_CELL_SHIFTS = np.array([[x, y, z] for x in (0.0, 0.5) for y in (0.0, 0.5) for z in (0.0, 0.5)])
+
+# Largest query x point distance matrix searched by brute force instead of building a tree
+_BRUTE_FORCE_PAIRS = 1 << 22
+
+# Spelled out name of each side and of its opposite, for mirrored names
+_SIDE_WORDS = {'L': ('Left', 'Right'), 'R': ('Right', 'Left')}
+
+# Side suffixes: "SmileL", "Smile_L", "SmileLeft", "Smile.Right", ... with the separator
+# (one of '.', '_', '-' or empty) captured so it can be reused for the mirrored name
+_SIDE_PATTERN = re.compile(r'(?P<base>[a-zA-Z0-9]+?)(?P<sep>[._-]?)(?P<side>L|R|Left|Right)$')
 
 def detect_shape_key_side(key_name):
     """Detect if a shape key name has L/R designation and return pattern info"""
+    base_name, from_side, separator = _match_side(key_name)
+    
     # Store information about the match for better name creation
-    pattern_info = {
-        'base_name': None,
-        'from_side': None,
-        'to_side': None,
-        'separator': None   # Will store separator like '_', '.', '-' or '' (empty for direct suffix)
+    return {
+        'base_name': base_name,
+        'from_side': from_side,
+        'to_side': None if from_side is None else ('R' if from_side == 'L' else 'L'),
+        'separator': separator   # Separator like '_', '.', '-' or '' (empty for direct suffix)
     }
+
+@functools.lru_cache(maxsize=1024)
+def _match_side(key_name):
+    """Cached (base_name, side, separator) of a shape key name, all None without a side suffix"""
+    match = _SIDE_PATTERN.match(key_name)
+    if not match:
+        return None, None, None
+    return match['base'], match['side'][0], match['sep']
+
+def get_vertex_coords(mesh_or_basis_key, out=None):
+    """Read all vertex coordinates of a mesh or shape key in a single bulk call
     
-    # Regular expression patterns for different naming conventions
-    left_patterns = [
-        (r'([a-zA-Z0-9]+)L$', ''),               # Direct suffix, e.g., "SmileL"
-        (r'([a-zA-Z0-9]+)[._-]L$', None),        # With separator (will be extracted)
-        (r'([a-zA-Z0-9]+)Left$', ''),            # Direct suffix, e.g., "SmileLeft"
-        (r'([a-zA-Z0-9]+)[._-]Left$', None)      # With separator
-    ]
-    
-    right_patterns = [
-        (r'([a-zA-Z0-9]+)R$', ''),               # Direct suffix, e.g., "SmileR"
-        (r'([a-zA-Z0-9]+)[._-]R$', None),        # With separator (will be extracted)
-        (r'([a-zA-Z0-9]+)Right$', ''),           # Direct suffix, e.g., "SmileRight"
-        (r'([a-zA-Z0-9]+)[._-]Right$', None)     # With separator
-    ]
-    
-    # Check if it's a left-side shape key
-    for pattern, sep in left_patterns:
-        match = re.match(pattern, key_name)
-        if match:
-            pattern_info['base_name'] = match.group(1)
-            pattern_info['from_side'] = 'L'
-            pattern_info['to_side'] = 'R'
-            
-            # If separator needs to be extracted
-            if sep is None:
-                # Find which separator was used
-                if '_L' in key_name:
-                    pattern_info['separator'] = '_'
-                elif '.L' in key_name:
-                    pattern_info['separator'] = '.'
-                elif '-L' in key_name:
-                    pattern_info['separator'] = '-'
-                # For names like "Smile_Left"
-                elif '_Left' in key_name:
-                    pattern_info['separator'] = '_'
-                elif '.Left' in key_name:
-                    pattern_info['separator'] = '.'
-                elif '-Left' in key_name:
-                    pattern_info['separator'] = '-'
-            else:
-                pattern_info['separator'] = sep
-            
-            break
-            
-    # If not found, check if it's a right-side shape key
-    if not pattern_info['base_name']:
-        for pattern, sep in right_patterns:
-            match = re.match(pattern, key_name)
-            if match:
-                pattern_info['base_name'] = match.group(1)
-                pattern_info['from_side'] = 'R'
-                pattern_info['to_side'] = 'L'
-                
-                # If separator needs to be extracted
-                if sep is None:
-                    # Find which separator was used
-                    if '_R' in key_name:
-                        pattern_info['separator'] = '_'
-                    elif '.R' in key_name:
-                        pattern_info['separator'] = '.'
-                    elif '-R' in key_name:
-                        pattern_info['separator'] = '-'
-                    # For names like "Smile_Right"
-                    elif '_Right' in key_name:
-                        pattern_info['separator'] = '_'
-                    elif '.Right' in key_name:
-                        pattern_info['separator'] = '.'
-                    elif '-Right' in key_name:
-                        pattern_info['separator'] = '-'
-                else:
-                    pattern_info['separator'] = sep
-                
-                break
-            
-    return pattern_info
+    Parameters:
+        mesh_or_basis_key: Either a mesh or a shape key to read coordinates from.
+            An (N, 3) coordinate array is passed through unchanged, so callers can
+            read the coordinates once and share them between the helpers below.
+        out: Optional contiguous (N, 3) float32 array to read into, so loops over
+            many shape keys can reuse one buffer
+    
+    Returns:
+        (N, 3) float32 array of vertex coordinates
+    """
+    if isinstance(mesh_or_basis_key, np.ndarray):
+        return mesh_or_basis_key
+    
+    # Shape keys have a .data attribute with vertex data
+    vertex_data = mesh_or_basis_key.data if hasattr(mesh_or_basis_key, 'data') else mesh_or_basis_key.vertices
+    
+    if out is None:
+        out = np.empty((len(vertex_data), 3), dtype=np.float32)
+    vertex_data.foreach_get("co", out.ravel())
+    return out
 
 def build_mirror_vertex_mapping(mesh_or_basis_key):
     """Build a mapping between vertices on opposite sides of the mesh or shape key
     
     Parameters:
-        mesh_or_basis_key: Either a mesh or a shape key to classify vertices from
+        mesh_or_basis_key: Either a mesh, a shape key or an (N, 3) coordinate array to classify vertices from
     
     Returns:
-        Tuple of (left_vertices, right_vertices, center_vertices)
+        Tuple of (left_vertices, right_vertices, center_vertices) int32 index arrays
     """
-    # Group vertices by their X sign (left/right of the center)
-    left_vertices = []  # X < 0
-    right_vertices = []  # X > 0
-    center_vertices = []  # X ≈ 0
-    
     # Small threshold for center vertices
     center_threshold = 0.0001
     
-    # Determine if we're working with a mesh or shape key
-    # Shape keys have a .data attribute with vertex data
-    is_shape_key = hasattr(mesh_or_basis_key, 'data')
-    
-    # Sorting vertices based on X coordinate sign
-    vertex_count = len(mesh_or_basis_key.data if is_shape_key else mesh_or_basis_key.vertices)
-    
-    for i in range(vertex_count):
-        if is_shape_key:
-            x_coord = mesh_or_basis_key.data[i].co.x
-        else:
-            x_coord = mesh_or_basis_key.vertices[i].co.x
-            
-        if abs(x_coord) < center_threshold:
-            center_vertices.append(i)
-        elif x_coord < 0:
-            left_vertices.append(i)
-        else:
-            right_vertices.append(i)
+    # Group vertices by their X sign (left/right of the center) using boolean masks
+    # on a strided view of the X column (no copy)
+    x_coords = get_vertex_coords(mesh_or_basis_key)[:, 0]
+    center_mask = np.abs(x_coords) < center_threshold
+    
+    left_vertices = np.flatnonzero(~center_mask & (x_coords < 0)).astype(np.int32)  # X < 0
+    right_vertices = np.flatnonzero(~center_mask & (x_coords > 0)).astype(np.int32)  # X > 0
+    center_vertices = np.flatnonzero(center_mask).astype(np.int32)  # X ≈ 0
     
     return left_vertices, right_vertices, center_vertices
 
-def create_vertex_mirror_mapping(object_data, from_side, left_vertices, right_vertices, center_vertices, tolerance=0.001):
+def create_vertex_mirror_mapping(object_data, from_side, left_vertices, right_vertices, tolerance=0.001, shape_coords=None):
     """Create a detailed mapping between source and target vertices for mirroring
     
     Parameters:
-        object_data: Either a mesh or shape key to get vertex coordinates from
+        object_data: Either a mesh, a shape key or an (N, 3) coordinate array to get vertex coordinates from
         from_side: 'L' for mirroring left to right, 'R' for right to left
-        left_vertices: List of vertex indices on the left side
-        right_vertices: List of vertex indices on the right side
-        center_vertices: List of vertex indices near the center
+        left_vertices: Array (or list) of vertex indices on the left side
+        right_vertices: Array (or list) of vertex indices on the right side
         tolerance: Maximum distance allowed between mirrored vertices
+        shape_coords: Optional (N, 3) shape key coordinates, when given only the source
+            vertices displaced from object_data are matched
     
     Returns:
-        Tuple of (source_vertices, target_vertices, mirror_map, reverse_map)
+        Tuple of (source_vertices, target_vertices, src_indices, tgt_indices) where
+        src_indices[i] mirrors onto tgt_indices[i]; both are read-only int32 arrays
+        holding only the matched vertices. Sources and targets lie on opposite sides,
+        so no vertex maps to itself (center vertices are not part of the mapping)
     """
-    # Build the mirror mapping
-    mirror_map = {}
+    # Find matches between left and right vertices
+    source_vertices = np.asarray(left_vertices if from_side == 'L' else right_vertices, dtype=np.int32)
+    target_vertices = np.asarray(right_vertices if from_side == 'L' else left_vertices, dtype=np.int32)
     
-    # Center vertices mirror to themselves
-    for i in center_vertices:
-        mirror_map[i] = i
+    coords = get_vertex_coords(object_data)
     
-    # Find matches between left and right vertices
-    source_vertices = left_vertices if from_side == 'L' else right_vertices
-    target_vertices = right_vertices if from_side == 'L' else left_vertices
-    
-    # Create an octree with the target vertices for efficient searching
-    octree = Octree()
-    
-    # Determine if we're working with a mesh or shape key
-    is_shape_key = hasattr(object_data, 'data')
-    
-    # Populate the octree with target vertices
-    for tgt_idx in target_vertices:
-        if is_shape_key:
-            tgt_co = object_data.data[tgt_idx].co
-        else:
-            tgt_co = object_data.vertices[tgt_idx].co
-            
-        search_point = (tgt_co.x, tgt_co.y, tgt_co.z)
-        octree.insert(search_point, tgt_idx)
-        
-    # For each source vertex, find the best match in the octree
-    for src_idx in source_vertices:
-        if is_shape_key:
-            src_co = object_data.data[src_idx].co
-        else:
-            src_co = object_data.vertices[src_idx].co
-        
-        # Create a query point with the mirrored X coordinate
-        query_point = (-src_co.x, src_co.y, src_co.z)
-        
-        # Find the nearest vertex in the octree within the tolerance distance
-        distance, best_match_idx = octree.find_nearest(query_point, max_dist=tolerance)
-        
-        # If we found a match, add it to the mapping
-        if best_match_idx is not None:
-            mirror_map[src_idx] = best_match_idx
-    
-    # Create a reverse mapping for efficient lookup: target_idx -> source_idx
-    reverse_map = {}
-    for src_idx, tgt_idx in mirror_map.items():
-        if src_idx != tgt_idx:  # Only include actual mappings (skip self-mapping for center vertices)
-            reverse_map[tgt_idx] = src_idx
-            
-    return source_vertices, target_vertices, mirror_map, reverse_map
-
-def generate_mirrored_name(shape_key_name, pattern_info, shape_keys):
-    """Generate a mirrored name for a shape key based on pattern info"""
+    # Undisplaced source vertices would only copy the basis, so they are not worth matching
+    matched_vertices = source_vertices
+    if shape_coords is not None and len(source_vertices):
+        displacement = shape_coords[source_vertices] - coords[source_vertices]
+        moved = np.einsum('ij,ij->i', displacement, displacement) >= 0.0001 ** 2
+        matched_vertices = source_vertices[moved]
+    
+    if len(matched_vertices) and len(target_vertices):
+        # Repeated mirrors on an unchanged mesh reuse the matches instead of searching again
+        cache_key = _match_cache_key(coords, matched_vertices, target_vertices, tolerance)
+        matches = _match_cache.get(cache_key)
+        if matches is None:
+            matches = _match_nearest(coords, matched_vertices, target_vertices, tolerance)
+            if len(_match_cache) >= _MATCH_CACHE_SIZE:
+                del _match_cache[next(iter(_match_cache))]
+            _match_cache[cache_key] = matches
+        src_indices, tgt_indices = matches
+    else:
+        src_indices = tgt_indices = np.empty(0, dtype=np.int32)
+    
+    return source_vertices, target_vertices, src_indices, tgt_indices
+
+def _match_cache_key(coords, source_vertices, target_vertices, tolerance):
+    """Build a cache key that changes whenever the geometry, partition or tolerance does"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(np.ascontiguousarray(coords).tobytes())
+    digest.update(np.asarray(source_vertices, dtype=np.int64).tobytes())
+    digest.update(np.asarray(target_vertices, dtype=np.int64).tobytes())
+    return digest.digest(), float(tolerance)
+
+def _match_nearest(coords, source_vertices, target_vertices, tolerance):
+    """Match mirrored source positions to target vertices
+    
+    Exact mirror pairs are resolved first, only the remaining source vertices go
+    through a nearest neighbour search.
+    
+    Returns:
+        Tuple of (matched_sources, matched_targets) read-only int32 index arrays
+    """
+    target_points = coords[target_vertices]
+    
+    # Create the query points with the mirrored X coordinate
+    query_points = coords[source_vertices]
+    query_points[:, 0] *= -1
+    
+    # Symmetrically modelled meshes pair up exactly, search only for the vertices that did not
+    matches = _find_exact_matches(target_points, query_points, tolerance)
+    pending = np.flatnonzero(matches < 0)
+    if len(pending):
+        matches[pending] = _find_nearest_matches(target_points, query_points[pending], tolerance)
+    
+    found = matches >= 0
+    matched_sources = source_vertices[found]
+    matched_targets = target_vertices[matches[found]]
+    # The arrays are shared through the match cache, callers must not modify them
+    matched_sources.setflags(write=False)
+    matched_targets.setflags(write=False)
+    return matched_sources, matched_targets
+
+def _find_exact_matches(target_points, query_points, tolerance):
+    """Pair query points with target points that land in the same cell of a fine grid
+    
+    Meshes modelled with mirroring flip to (almost) bit-identical positions, so a
+    sort based hash join on the snapped coordinates resolves those pairs without any
+    spatial search. Cells are a fraction of the tolerance, so every pair found here
+    is well within it.
+    
+    Two points closer than half a cell on every axis share a cell in at least one of
+    the grids shifted by half a cell per axis, so pairs that straddle a cell border
+    are retried on the shifted grids (only while most queries have been paired, an
+    asymmetric mesh goes straight to the nearest neighbour search).
+    
+    Returns:
+        Target index for every query point, -1 where no exact partner was found
+    """
+    matches = np.full(len(query_points), -1, dtype=np.int64)
+    resolution = tolerance / 16
+    
+    origin = np.minimum(target_points.min(axis=0), query_points.min(axis=0)).astype(np.float64)
+    target_scaled = (target_points - origin) / resolution
+    query_scaled = (query_points - origin) / resolution
+    
+    pending = np.arange(len(query_points))
+    for shift in _HALF_CELL_SHIFTS:
+        hits, positions = _join_cells(np.round(target_scaled + shift).astype(np.int64),
+                                      np.round(query_scaled[pending] + shift).astype(np.int64))
+        if hits is None:
+            break
+        matches[pending[hits]] = positions
+        pending = pending[matches[pending] < 0]
+        if not len(pending) or len(pending) * 2 > len(query_points):
+            break
+    return matches
+
+def _join_cells(target_cells, query_cells):
+    """Look every query cell up among the target cells
+    
+    Returns:
+        Tuple of (hit query rows, matching target index per hit), or (None, None)
+        if the grid is too fine to pack a cell into one integer key
+    """
+    # Pack the three cell coordinates into a single integer key
+    dims = np.maximum(target_cells.max(axis=0), query_cells.max(axis=0)) + 1
+    if float(dims[0]) * float(dims[1]) * float(dims[2]) >= 2.0 ** 62:
+        return None, None
+    target_keys = (target_cells[:, 0] * dims[1] + target_cells[:, 1]) * dims[2] + target_cells[:, 2]
+    query_keys = (query_cells[:, 0] * dims[1] + query_cells[:, 1]) * dims[2] + query_cells[:, 2]
+    
+    # Look every query key up in the sorted target keys
+    order = np.argsort(target_keys)
+    sorted_keys = target_keys[order]
+    positions = np.minimum(np.searchsorted(sorted_keys, query_keys), len(sorted_keys) - 1)
+    hits = np.flatnonzero(sorted_keys[positions] == query_keys)
+    return hits, order[positions[hits]]
+
+def _find_nearest_matches(target_points, query_points, tolerance):
+    """Find the nearest target point within tolerance for every query point in one batched search
+    
+    Uses SciPy's cKDTree when available, otherwise the Numba compiled KDTree from core,
+    and a pure NumPy UniformGrid over (Y, Z) when neither is installed.
+    
+    Returns:
+        Target index for every query point, -1 where nothing lies within tolerance
+    """
+    # After the exact pass only a handful of queries are usually left, one distance matrix beats a tree build
+    if len(query_points) * len(target_points) <= _BRUTE_FORCE_PAIRS:
+        return nearest_indices(query_points, target_points, max_dist=tolerance)
+    
+    if cKDTree is not None:
+        distances, matches = cKDTree(target_points).query(
+            query_points, k=1, distance_upper_bound=tolerance, workers=-1)
+        # Unmatched queries come back with an infinite distance
+        return np.where(np.isfinite(distances), matches, -1)
+    
+    if HAS_NUMBA:
+        return KDTree(target_points).query(query_points, max_dist=tolerance)[1]
+    
+    # Cells as wide as the tolerance keep every candidate within the 3x3 cell probe
+    return UniformGrid(target_points, cell_size=tolerance).query(query_points, max_dist=tolerance)[1]
+
+def nearest_indices(query_points, points, max_dist=float('inf'), chunk=4096):
+    """Find the nearest of points for every query point with chunked pairwise distances
+    
+    Each chunk of queries is compared to all points in a single matrix product, so the
+    intermediate matrix stays at chunk x len(points) values however many queries there are.
+    
+    Returns:
+        Index into points for every query point, -1 where nothing lies within max_dist
+    """
+    query_points = np.asarray(query_points, dtype=np.float64)
+    points = np.asarray(points, dtype=np.float64)
+    matches = np.full(len(query_points), -1, dtype=np.int64)
+    if not len(points):
+        return matches
+    
+    points_sq = np.einsum('ij,ij->i', points, points)
+    max_dist_sq = max_dist * max_dist
+    for start in range(0, len(query_points), chunk):
+        block = query_points[start:start + chunk]
+        # |q - p|^2 = |q|^2 - 2 q.p + |p|^2
+        dist_sq = points_sq - 2.0 * (block @ points.T)
+        dist_sq += np.einsum('ij,ij->i', block, block)[:, None]
+        nearest = dist_sq.argmin(axis=1)
+        within = dist_sq[np.arange(len(block)), nearest] <= max_dist_sq
+        matches[start:start + chunk] = np.where(within, nearest, -1)
+    return matches
+
+def apply_mirrored_displacement(basis_coords, source_coords, src_indices, tgt_indices, threshold=0.0001, out=None):
+    """Mirror the source displacement from the basis onto the matched target vertices
+    
+    Parameters:
+        basis_coords: (N, 3) basis coordinates
+        source_coords: (N, 3) coordinates of the shape key being mirrored
+        src_indices, tgt_indices: Paired vertex indices from create_vertex_mirror_mapping()
+        threshold: Source vertices displaced less than this are left at the basis
+        out: Optional float32 (N, 3) array to write the result into, so loops over
+            many shape keys can reuse one buffer
+    
+    A target matched by several sources takes the displacement of the last of them
+    (in mapping order) that moved.
+    
+    Returns:
+        Tuple of (new_coords, mirrored_count) with new_coords a float32 (N, 3) array
+        and mirrored_count the number of target vertices written
+    """
+    basis_coords = np.asarray(basis_coords, dtype=np.float32)
+    if out is None:
+        new_coords = basis_coords.copy()
+    else:
+        new_coords = out
+        np.copyto(new_coords, basis_coords)
+    if not len(src_indices):
+        return new_coords, 0
+    
+    if HAS_NUMBA:
+        # Group the pairs by target so each parallel iteration owns one target vertex
+        order = np.argsort(tgt_indices, kind='stable')
+        sorted_targets = tgt_indices[order]
+        group_bounds = np.flatnonzero(np.diff(sorted_targets)) + 1
+        group_bounds = np.concatenate(([0], group_bounds, [len(order)]))
+        mirrored_count = _apply_mirror_kernel(
+            new_coords, basis_coords, np.asarray(source_coords, dtype=np.float32),
+            src_indices[order], sorted_targets, group_bounds, threshold * threshold)
+        return new_coords, int(mirrored_count)
+    
+    # Get the displacement from basis in the original shape key
+    displacement = source_coords[src_indices] - basis_coords[src_indices]
+    
+    # Skip vertices with no displacement (not affected by shape key)
+    moved = np.einsum('ij,ij->i', displacement, displacement) >= threshold * threshold
+    tgt_indices = tgt_indices[moved]
+    displacement = displacement[moved]
+    
+    # Keep the last moved source of every target (the first occurrence in reversed order)
+    tgt_indices, last = np.unique(tgt_indices[::-1], return_index=True)
+    displacement = displacement[len(displacement) - 1 - last]
+    
+    # Mirror the displacement - we flip the X component for mirroring
+    displacement[:, 0] *= -1
+    new_coords[tgt_indices] += displacement
+    return new_coords, len(tgt_indices)
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _apply_mirror_kernel(out, basis, source, src_indices, tgt_indices, group_bounds, threshold_sq):
+    """Write the X-mirrored displacement of the last moved source of each target, in parallel
+       The pairs are sorted by target, group_bounds delimits the pairs sharing one target
+    """
+    mirrored_count = 0
+    for g in prange(group_bounds.shape[0] - 1):
+        # Walk each group backwards, so the last moved source in mapping order wins
+        for i in range(group_bounds[g + 1] - 1, group_bounds[g] - 1, -1):
+            src = src_indices[i]
+            tgt = tgt_indices[i]
+            dx = source[src, 0] - basis[src, 0]
+            dy = source[src, 1] - basis[src, 1]
+            dz = source[src, 2] - basis[src, 2]
+            if dx * dx + dy * dy + dz * dz < threshold_sq:
+                continue
+            out[tgt, 0] = basis[tgt, 0] - dx
+            out[tgt, 1] = basis[tgt, 1] + dy
+            out[tgt, 2] = basis[tgt, 2] + dz
+            mirrored_count += 1
+            break
+    return mirrored_count
+
+def generate_mirrored_name(shape_key_name, pattern_info, existing_names):
+    """Generate a mirrored name for a shape key based on pattern info
+    
+    existing_names is the set of shape key names already taken (an empty set gives
+    the clean mirrored name); callers mirroring several keys keep it up to date
+    """
     # If we couldn't determine the side, use _Mirror suffix
     if not pattern_info['base_name']:
         new_key_name = f"{shape_key_name}_Mirror"
     else:
-        # Create the new name using the pattern information
-        base_name = pattern_info['base_name']
+        # Create the new name using the pattern information, spelling the side out
+        # ("Left"/"Right") when the source name spells out the opposite side
         to_side = pattern_info['to_side']
-        separator = pattern_info['separator']
-        
-        # Handle special cases for "Left" and "Right"
-        if to_side == 'L' and 'Right' in shape_key_name:
-            if separator:
-                new_key_name = base_name + separator + 'Left'
-            else:
-                new_key_name = base_name + 'Left'
-        elif to_side == 'R' and 'Left' in shape_key_name:
-            if separator:
-                new_key_name = base_name + separator + 'Right'
-            else:
-                new_key_name = base_name + 'Right'
-        else:
-            # Standard L/R naming
-            if separator:
-                new_key_name = base_name + separator + to_side
-            else:
-                new_key_name = base_name + to_side
+        side_word, opposite_word = _SIDE_WORDS[to_side]
+        side = side_word if opposite_word in shape_key_name else to_side
+        new_key_name = f"{pattern_info['base_name']}{pattern_info['separator'] or ''}{side}"
     
     # Check if the shape key with the new name already exists
-    if shape_keys and new_key_name in shape_keys:
+    if new_key_name in existing_names:
         new_key_name = f"{new_key_name}_Mirror"
         # Check again with the modified name
-        if new_key_name in shape_keys:
+        if new_key_name in existing_names:
             i = 1
-            while f"{new_key_name}_{i}" in shape_keys:
+            while f"{new_key_name}_{i}" in existing_names:
                 i += 1
             new_key_name = f"{new_key_name}_{i}"
     
@@ -1,9 +1,37 @@
 import bpy
 import json
+import numpy as np
+from dataclasses import dataclass, field
 from bpy.types import Operator
 
-# Reference to global variable
-from .. import copied_shape_keys
+# Files are always written by the standard library so they keep the same layout,
+# orjson only speeds up loading when it is installed (it is not bundled with Blender)
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
+
+@dataclass(slots=True)
+class _Clipboard:
+    """Copied shape key values as paired name and value arrays"""
+    names: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=str))
+    values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float32))
+    
+    def __len__(self):
+        return len(self.values)
+    
+    def store(self, key_blocks):
+        """Copy the values of every shape key except the basis, returns all values read"""
+        all_values = np.empty(len(key_blocks), dtype=np.float32)
+        key_blocks.foreach_get("value", all_values)
+        # Skip the basis shape key (always at index 0)
+        self.names = np.array([key.name for key in key_blocks[1:]], dtype=str)
+        self.values = all_values[1:].copy()
+        return all_values
+
+# Values shared by copy, cut and paste
+_clipboard = _Clipboard()
 
 class SHAPEKEY_OT_copy(Operator):
     """Copy all shape key values from selected object"""
@@ -16,20 +44,12 @@ class SHAPEKEY_OT_copy(Operator):
         return obj and obj.type == 'MESH' and obj.data.shape_keys
     
     def execute(self, context):
-        global copied_shape_keys
         obj = context.active_object
         
-        # Clear previous data
-        copied_shape_keys.clear()
-        
-        # Store shape key values
-        if obj.data.shape_keys:
-            for key in obj.data.shape_keys.key_blocks:
-                # Skip the basis shape key (always at index 0)
-                if key.name != 'Basis':
-                    copied_shape_keys[key.name] = key.value
+        # Store shape key values (replaces previous data)
+        _clipboard.store(obj.data.shape_keys.key_blocks)
         
-        self.report({'INFO'}, f"Copied {len(copied_shape_keys)} shape key values")
+        self.report({'INFO'}, f"Copied {len(_clipboard)} shape key values")
         return {'FINISHED'}
 
 class SHAPEKEY_OT_cut(Operator):
@@ -44,21 +64,17 @@ class SHAPEKEY_OT_cut(Operator):
         return obj and obj.type == 'MESH' and obj.data.shape_keys
     
     def execute(self, context):
-        global copied_shape_keys
         obj = context.active_object
+        key_blocks = obj.data.shape_keys.key_blocks
         
-        # Clear previous data
-        copied_shape_keys.clear()
-        
-        # Store shape key values and set to zero
-        if obj.data.shape_keys:
-            for key in obj.data.shape_keys.key_blocks:
-                # Skip the basis shape key
-                if key.name != 'Basis':
-                    copied_shape_keys[key.name] = key.value
-                    key.value = 0.0
+        # Store shape key values and set them to zero in one write (the basis keeps its value)
+        all_values = _clipboard.store(key_blocks)
+        all_values[1:] = 0.0
+        key_blocks.foreach_set("value", all_values)
+        # The bulk write skips the value update callbacks, so tag the keys to redraw the mesh
+        obj.data.shape_keys.update_tag()
         
-        self.report({'INFO'}, f"Cut {len(copied_shape_keys)} shape key values")
+        self.report({'INFO'}, f"Cut {len(_clipboard)} shape key values")
         return {'FINISHED'}
 
 class SHAPEKEY_OT_paste(Operator):
@@ -70,19 +86,23 @@ class SHAPEKEY_OT_paste(Operator):
     @classmethod
     def poll(cls, context):
         obj = context.active_object
-        return obj and obj.type == 'MESH' and obj.data.shape_keys and copied_shape_keys
+        return obj and obj.type == 'MESH' and obj.data.shape_keys and len(_clipboard) > 0
     
     def execute(self, context):
         obj = context.active_object
-        pasted_count = 0
+        key_blocks = obj.data.shape_keys.key_blocks
         
-        if obj.data.shape_keys:
-            for key in obj.data.shape_keys.key_blocks:
-                if key.name in copied_shape_keys:
-                    key.value = copied_shape_keys[key.name]
-                    pasted_count += 1
+        # Match the copied names to this object's keys, then write all values in one call
+        names = np.array([key.name for key in key_blocks], dtype=str)
+        _, key_indices, copied_indices = np.intersect1d(names, _clipboard.names, return_indices=True)
+        
+        all_values = np.empty(len(key_blocks), dtype=np.float32)
+        key_blocks.foreach_get("value", all_values)
+        all_values[key_indices] = _clipboard.values[copied_indices]
+        key_blocks.foreach_set("value", all_values)
+        obj.data.shape_keys.update_tag()
         
-        self.report({'INFO'}, f"Pasted {pasted_count} shape key values")
+        self.report({'INFO'}, f"Pasted {len(key_indices)} shape key values")
         return {'FINISHED'}
 
 class SHAPEKEY_OT_save(Operator):
@@ -101,9 +121,8 @@ class SHAPEKEY_OT_save(Operator):
         data_to_save = {}
         
         if obj.data.shape_keys:
-            for key in obj.data.shape_keys.key_blocks:
-                if key.name != 'Basis':
-                    data_to_save[key.name] = key.value
+            for key in obj.data.shape_keys.key_blocks[1:]:
+                data_to_save[key.name] = key.value
         
         with open(self.filepath, 'w') as f:
             json.dump(data_to_save, f, indent=4)
@@ -131,8 +150,8 @@ class SHAPEKEY_OT_load(Operator):
         obj = context.active_object
         
         try:
-            with open(self.filepath, 'r') as f:
-                loaded_data = json.load(f)
+            with open(self.filepath, 'rb') as f:
+                loaded_data = _loads(f.read())
             
             pasted_count = 0
             if obj.data.shape_keys:
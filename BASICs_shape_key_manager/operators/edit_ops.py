@@ -1,6 +1,8 @@
 import bpy
+import numpy as np
 from bpy.types import Operator
 from bpy.props import BoolProperty
+from ..core.mirror_utils import get_vertex_coords
 
 class SHAPEKEY_OT_remove_selected_vertices(Operator):
     """Remove selected vertices from shape keys by resetting them to basis position"""
@@ -33,9 +35,11 @@ class SHAPEKEY_OT_remove_selected_vertices(Operator):
         
         # Get selected vertices
         bpy.ops.object.mode_set(mode='OBJECT')  # Need to be in object mode to access selection
-        selected_vertices = [v.index for v in obj.data.vertices if v.select]
+        selection = np.empty(len(obj.data.vertices), dtype=bool)
+        obj.data.vertices.foreach_get("select", selection)
+        selected_vertices = np.flatnonzero(selection)
         
-        if not selected_vertices:
+        if not len(selected_vertices):
             bpy.ops.object.mode_set(mode='EDIT')  # Return to edit mode
             self.report({'WARNING'}, "No vertices selected")
             return {'CANCELLED'}
@@ -53,12 +57,17 @@ class SHAPEKEY_OT_remove_selected_vertices(Operator):
                 self.report({'WARNING'}, "Active shape key is Basis or not set")
                 return {'CANCELLED'}
         
-        # Reset selected vertices in each shape key to their basis position
+        # Reset selected vertices in each shape key to their basis position,
+        # one bulk read and write per key into a reused buffer
+        basis_coords = get_vertex_coords(basis_key)
+        selected_basis = basis_coords[selected_vertices]
+        key_coords = np.empty_like(basis_coords)
         modified_count = 0
         for key in keys_to_process:
-            for v_idx in selected_vertices:
-                # Copy the basis position to the shape key
-                key.data[v_idx].co = basis_key.data[v_idx].co
+            get_vertex_coords(key, out=key_coords)
+            # Copy the basis position to the shape key
+            key_coords[selected_vertices] = selected_basis
+            key.data.foreach_set("co", key_coords.ravel())
             modified_count += 1
         
         # Return to edit mode
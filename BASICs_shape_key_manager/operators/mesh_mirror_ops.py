@@ -1,10 +1,9 @@
 import bpy
 import bmesh
+import numpy as np
 from bpy.types import Operator
 from bpy.props import FloatProperty, BoolProperty
-from mathutils import Vector
-from ..core import Octree
-from ..core.mirror_utils import build_mirror_vertex_mapping, create_vertex_mirror_mapping
+from ..core.mirror_utils import get_vertex_coords, build_mirror_vertex_mapping, create_vertex_mirror_mapping
 
 # Helper functions for mesh mirroring operations
 def get_selected_vertices(obj):
@@ -14,48 +13,52 @@ def get_selected_vertices(obj):
     selected_verts = [v.index for v in bm.verts if v.select]
     return selected_verts
 
-def find_mirrors_of_selected(selected_verts, reverse_map):
+def find_mirrors_of_selected(selected_verts, src_indices, tgt_indices):
     """Find the mirror vertices of selected vertices"""
-    mirror_verts = []
-    for v_idx in selected_verts:
-        mirror_idx = reverse_map.get(v_idx)
-        if mirror_idx is not None:
-            mirror_verts.append(mirror_idx)
-    return mirror_verts
+    return src_indices[np.isin(tgt_indices, selected_verts)]
 
-def apply_mirror_transformation(mesh, mirror_map, from_side='L'):
-    """Apply precise mirroring to vertices based on mapping"""
-    modified_vertices = set()
+def apply_mirror_transformation(mesh, src_indices, tgt_indices, from_side='L', coords=None):
+    """Apply precise mirroring to vertices based on mapping
     
-    for src_idx, tgt_idx in mirror_map.items():
-        if src_idx != tgt_idx:  # Skip center vertices that map to themselves
-            src_co = mesh.vertices[src_idx].co
-            
-            # Mirror coordinates (flip X component)
-            mirrored_co = Vector((-src_co.x, src_co.y, src_co.z))
-            
-            # Apply to target vertex
-            mesh.vertices[tgt_idx].co = mirrored_co
-            modified_vertices.add(tgt_idx)
+    coords may be the current (N, 3) mesh coordinates, which are then updated in place
+    instead of being read again. Returns the indices of the modified vertices
+    """
+    if not len(src_indices):
+        return np.empty(0, dtype=np.int32)
     
-    return modified_vertices
+    # The paired arrays never map a vertex to itself, every pair is a real mirror
+    if coords is None:
+        coords = get_vertex_coords(mesh)
+    
+    # Mirror coordinates (flip X component) and apply them to the target vertices in one write
+    mirrored_co = coords[src_indices]
+    mirrored_co[:, 0] *= -1
+    coords[tgt_indices] = mirrored_co
+    mesh.vertices.foreach_set("co", coords.ravel())
+    mesh.update()
+    
+    return np.unique(tgt_indices)
 
-def handle_center_vertices(mesh, center_vertices, move_to_center=True, center_tolerance=0.0001):
-    """Process vertices near the center line"""
-    modified_vertices = set()
+def handle_center_vertices(mesh, center_vertices, move_to_center=True, center_tolerance=0.0001, coords=None):
+    """Process vertices near the center line
     
-    # Find vertices within the center tolerance
-    near_center = []
-    for v_idx in range(len(mesh.vertices)):
-        if abs(mesh.vertices[v_idx].co.x) <= center_tolerance:
-            near_center.append(v_idx)
+    coords may be the current (N, 3) mesh coordinates, which are then updated in place
+    """
+    modified_vertices = []
+    
+    # Find vertices within the center tolerance from one bulk read of the coordinates
+    if coords is None:
+        coords = get_vertex_coords(mesh)
+    near_center = np.flatnonzero(np.abs(coords[:, 0]) <= center_tolerance).tolist()
     
     # Process center vertices if requested
-    if move_to_center:
-        for v_idx in near_center:
-            # Force vertex exactly to center (X=0)
-            mesh.vertices[v_idx].co.x = 0.0
-            modified_vertices.add(v_idx)
+    if move_to_center and near_center:
+        # Force vertices exactly to center (X=0)
+        coords[near_center, 0] = 0.0
+        mesh.vertices.foreach_set("co", coords.ravel())
+        # The bulk write does not tag the mesh, update it once so normals and the viewport follow
+        mesh.update()
+        modified_vertices = near_center
     
     return modified_vertices, near_center
 
@@ -170,8 +173,12 @@ class MESH_OT_force_mirror(Operator):
             # Switch to object mode to perform the operation
             bpy.ops.object.mode_set(mode='OBJECT')
         
+        # Read the mesh coordinates once and share them between the mapping and mirroring helpers
+        # (the helpers that move vertices keep this array in sync with the mesh)
+        mesh_coords = get_vertex_coords(mesh)
+        
         # Build initial vertex mappings using common function
-        left_vertices, right_vertices, center_vertices = build_mirror_vertex_mapping(mesh)
+        left_vertices, right_vertices, center_vertices = build_mirror_vertex_mapping(mesh_coords)
         
         # Determine which side to mirror from based on settings
         if self.mirror_from_left and not self.mirror_from_right:
@@ -187,28 +194,26 @@ class MESH_OT_force_mirror(Operator):
             self.mirror_from_right = False
         
         # Create detailed vertex mapping using common function
-        source_vertices, target_vertices, mirror_map, reverse_map = create_vertex_mirror_mapping(
-            mesh, from_side, left_vertices, right_vertices, center_vertices, tolerance)
+        source_vertices, target_vertices, src_indices, tgt_indices = create_vertex_mirror_mapping(
+            mesh_coords, from_side, left_vertices, right_vertices, tolerance)
         
         # Handle center vertices
         center_modified, near_center_verts = handle_center_vertices(
-            mesh, center_vertices, self.move_to_center, self.center_tolerance)
+            mesh, center_vertices, self.move_to_center, self.center_tolerance, mesh_coords)
         
         # Process different cases based on mode
         if original_mode == 'EDIT':
             # In edit mode, we only affect mirrors of selected vertices
             if selected_verts:
                 # Get the mirrors of selected vertices
-                mirror_verts = find_mirrors_of_selected(selected_verts, reverse_map)
+                mirror_verts = find_mirrors_of_selected(selected_verts, src_indices, tgt_indices)
                 
-                # We need to filter mirror_map to only include entries affecting mirror_verts
-                filtered_map = {}
-                for src_idx, tgt_idx in mirror_map.items():
-                    if tgt_idx in mirror_verts:
-                        filtered_map[src_idx] = tgt_idx
+                # We need to filter the mapping to only include entries affecting mirror_verts
+                affected = np.isin(tgt_indices, mirror_verts)
                 
                 # Apply mirror transformation
-                modified_vertices = apply_mirror_transformation(mesh, filtered_map, from_side)
+                modified_vertices = apply_mirror_transformation(
+                    mesh, src_indices[affected], tgt_indices[affected], from_side, mesh_coords)
                 
                 # Update selection if requested
                 if self.select_mirrored:
@@ -221,7 +226,7 @@ class MESH_OT_force_mirror(Operator):
                         v.select = False
                     
                     # Select the mirrored vertices
-                    for v_idx in mirror_verts:
+                    for v_idx in mirror_verts.tolist():
                         bm.verts[v_idx].select = True
                     
                     # Update the edit mesh
@@ -229,13 +234,13 @@ class MESH_OT_force_mirror(Operator):
                     bpy.ops.object.mode_set(mode='OBJECT')
             else:
                 self.report({'WARNING'}, "No vertices selected in Edit Mode")
-                modified_vertices = set()
+                modified_vertices = []
         else:
             # In object mode, apply to all vertices
-            modified_vertices = apply_mirror_transformation(mesh, mirror_map, from_side)
+            modified_vertices = apply_mirror_transformation(mesh, src_indices, tgt_indices, from_side, mesh_coords)
         
         # Count failed vertices (only source vertices that weren't mapped)
-        failed_vertices = [v_idx for v_idx in source_vertices if v_idx not in mirror_map]
+        failed_vertices = np.setdiff1d(source_vertices, src_indices).tolist()
         
         # Create a vertex group for failed vertices if requested
         if self.create_failed_group and failed_vertices:
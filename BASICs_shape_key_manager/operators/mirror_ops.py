@@ -1,51 +1,43 @@
 import bpy
-import re
+import numpy as np
 from bpy.types import Operator
 from bpy.props import FloatProperty, BoolProperty
-from mathutils import Vector
-from ..core import Octree
-from ..core.mirror_utils import detect_shape_key_side, generate_mirrored_name, build_mirror_vertex_mapping, create_vertex_mirror_mapping
+from ..core.mirror_utils import detect_shape_key_side, generate_mirrored_name, get_vertex_coords, build_mirror_vertex_mapping, create_vertex_mirror_mapping, apply_mirrored_displacement
+
+# Below this fraction of changed vertices, setting them one by one beats rewriting the whole key
+_SCATTER_WRITE_FRACTION = 0.01
 
 # Helper functions for shape key mirroring operations
-def mirror_shape_key(obj, source_key, new_key_name, basis_key, target_vertices, reverse_map):
-    """Apply mirroring to create a new shape key"""
+def mirror_shape_key(obj, source_key, new_key_name, basis_key, src_indices, tgt_indices, source_coords=None, out=None):
+    """Apply mirroring to create a new shape key
+    
+    src_indices[i] is the source vertex mirrored onto target vertex tgt_indices[i].
+    basis_key may also be the (N, 3) basis coordinates and source_coords the already
+    read coordinates of source_key, so callers mirroring many keys read each only once.
+    out is an optional float32 (N, 3) scratch buffer for the mirrored coordinates.
+    """
     # Create a new shape key
     new_key = obj.shape_key_add(name=new_key_name, from_mix=False)
     new_key.interpolation = source_key.interpolation
     
-    # First, copy the basis shape key to the new shape key
-    for i in range(len(obj.data.vertices)):
-        new_key.data[i].co = basis_key.data[i].co
+    # Read the basis and source shape key coordinates in bulk (unless they were passed in)
+    basis_coords = get_vertex_coords(basis_key)
+    if source_coords is None:
+        source_coords = get_vertex_coords(source_key)
     
-    # Only modify vertices on the TARGET side of the mesh
-    modified_vertices = set()  # Keep track of vertices we've modified
-    mirrored_count = 0
+    # Start from the basis and apply the mirrored displacement to the target vertices
+    new_coords, mirrored_count = apply_mirrored_displacement(
+        basis_coords, source_coords, src_indices, tgt_indices, out=out)
     
-    # For each vertex on the target side, check if we need to update it
-    for tgt_idx in target_vertices:
-        # Efficient lookup using the reverse mapping
-        src_idx = reverse_map.get(tgt_idx)
-        
-        if src_idx is not None:
-            # Get the displacement from basis in the original shape key
-            basis_co = basis_key.data[src_idx].co
-            active_co = source_key.data[src_idx].co
-            displacement = active_co - basis_co
-            
-            # Skip vertices with no displacement (not affected by shape key)
-            if displacement.length < 0.0001:
-                continue
-                
-            # Mirror the displacement - we flip the X component for mirroring
-            mirrored_displacement = Vector((-displacement.x, displacement.y, displacement.z))
-            
-            # Target basis coordinate
-            target_basis_co = basis_key.data[tgt_idx].co
-            
-            # Apply the mirrored displacement to the target vertex
-            new_key.data[tgt_idx].co = target_basis_co + mirrored_displacement
-            modified_vertices.add(tgt_idx)
-            mirrored_count += 1
+    # A key added without from_mix already holds the basis, so only the changed targets need writing
+    if mirrored_count:
+        changed = tgt_indices[(new_coords[tgt_indices] != basis_coords[tgt_indices]).any(axis=1)]
+        if len(changed) < _SCATTER_WRITE_FRACTION * len(new_coords):
+            key_data = new_key.data
+            for vertex_idx, co in zip(changed.tolist(), new_coords[changed].tolist()):
+                key_data[vertex_idx].co = co
+        else:
+            new_key.data.foreach_set("co", new_coords.ravel())
     
     return new_key, mirrored_count
 
@@ -101,28 +93,30 @@ class SHAPEKEY_OT_mirror(Operator):
             self.report({'WARNING'}, "Could not determine side from shape key name. Use naming like 'SmileL' or 'Smile_R'")
             
         # Generate the mirrored name
-        new_key_name = generate_mirrored_name(active_key_name, pattern_info, shape_keys)
+        new_key_name = generate_mirrored_name(active_key_name, pattern_info, set(shape_keys.keys()))
+        
+        # Read the basis coordinates once and share them between the mapping helpers
+        basis_coords = get_vertex_coords(basis_key)
         
         # Build initial vertex mappings using common function
-        left_vertices, right_vertices, center_vertices = build_mirror_vertex_mapping(basis_key)
+        left_vertices, right_vertices, center_vertices = build_mirror_vertex_mapping(basis_coords)
         
         # Create detailed vertex mapping using common function
         from_side = pattern_info.get('from_side')
-        source_vertices, target_vertices, mirror_map, reverse_map = create_vertex_mirror_mapping(
-            basis_key, from_side, left_vertices, right_vertices, center_vertices, tolerance)
-        
-        # Count vertices we'll be mirroring
-        mapped_count = len([k for k, v in mirror_map.items() if k != v])
-        self.report({'INFO'}, f"Found {mapped_count} vertices to mirror from {len(source_vertices)} source vertices")
+        # Only the vertices the shape key actually moves need a mirror match
+        active_coords = get_vertex_coords(active_key)
+        source_vertices, target_vertices, src_indices, tgt_indices = create_vertex_mirror_mapping(
+            basis_coords, from_side, left_vertices, right_vertices, tolerance,
+            shape_coords=active_coords)
         
         # Create the mirrored shape key
         new_key, mirrored_count = mirror_shape_key(
-            obj, active_key, new_key_name, basis_key, target_vertices, reverse_map)
+            obj, active_key, new_key_name, basis_coords, src_indices, tgt_indices, active_coords)
         
-        # Set the new shape key as active
-        obj.active_shape_key_index = obj.data.shape_keys.key_blocks.find(new_key_name)
+        # Set the new shape key as active (shape_key_add appends it as the last key block)
+        obj.active_shape_key_index = len(obj.data.shape_keys.key_blocks) - 1
         
-        self.report({'INFO'}, f"Created mirrored shape key '{new_key_name}' (mirrored {mirrored_count} vertices)")
+        self.report({'INFO'}, f"Created mirrored shape key '{new_key_name}' (mirrored {mirrored_count} of {len(source_vertices)} source vertices)")
         return {'FINISHED'}
         
     def invoke(self, context, event):
@@ -177,8 +171,11 @@ class SHAPEKEY_OT_mirror_all_missing(Operator):
         
         basis_key = shape_keys['Basis']
         
+        # Read the basis coordinates once and share them between the mapping helpers
+        basis_coords = get_vertex_coords(basis_key)
+        
         # Build initial vertex mappings (only need to do this once)
-        left_vertices, right_vertices, center_vertices = build_mirror_vertex_mapping(basis_key)
+        left_vertices, right_vertices, center_vertices = build_mirror_vertex_mapping(basis_coords)
         
         # Keep track of which keys we've seen and created
         mirrored_keys = []
@@ -198,43 +195,68 @@ class SHAPEKEY_OT_mirror_all_missing(Operator):
             else:
                 ambiguous_keys.append(key)
         
+        # Names taken so far, kept in sync as mirrors are created
+        existing_names = set(shape_keys.keys())
+        
+        # Mirrored coordinates of each new key, written out before the next key reuses the buffer
+        mirror_coords = np.empty_like(basis_coords)
+        
+        # Mirror mappings depend only on the basis and the side mirrored from, so each side is
+        # matched once and shared by every key mirrored from it
+        side_mappings = {}
+        
         # Process keys that have side designation
         for key, pattern_info in side_identified_keys:
             # Generate the opposite side name
-            expected_mirror_name = generate_mirrored_name(key.name, pattern_info, {})  # Empty dict to get clean name
+            expected_mirror_name = generate_mirrored_name(key.name, pattern_info, set())  # Empty set to get clean name
             
             # Check if a mirror already exists
-            mirror_exists = False
-            for existing_key in shape_keys:
-                # Compare with the base name only
-                if existing_key.name == expected_mirror_name:
-                    mirror_exists = True
-                    break
-            
-            if mirror_exists:
+            if expected_mirror_name in existing_names:
                 skipped_keys.append(key.name)
                 continue
             
-            # Get the final name (handling potential conflicts)
-            new_key_name = generate_mirrored_name(key.name, pattern_info, shape_keys)
+            # The clean name is known to be free, so it is the final name
+            new_key_name = expected_mirror_name
             
-            # Create detailed vertex mapping
-            source_vertices, target_vertices, mirror_map, reverse_map = create_vertex_mirror_mapping(
-                basis_key, pattern_info['from_side'], left_vertices, right_vertices, center_vertices, tolerance)
+            # Reuse the mapping of this side (vertices the key does not move are skipped when mirroring)
+            from_side = pattern_info['from_side']
+            if from_side not in side_mappings:
+                side_mappings[from_side] = create_vertex_mirror_mapping(
+                    basis_coords, from_side, left_vertices, right_vertices, tolerance)
+            source_vertices, target_vertices, src_indices, tgt_indices = side_mappings[from_side]
+            key_coords = get_vertex_coords(key)
             
             # Create the mirrored shape key
             new_key, mirrored_count = mirror_shape_key(
-                obj, key, new_key_name, basis_key, target_vertices, reverse_map)
+                obj, key, new_key_name, basis_coords, src_indices, tgt_indices, key_coords, mirror_coords)
+            existing_names.add(new_key_name)
             
             mirrored_keys.append((key.name, new_key_name))
+        
+        # Mirrors created above, ambiguous keys with these names are not mirrored again
+        created_names = {mirror_name for _, mirror_name in mirrored_keys}
+        
+        if ambiguous_keys:
+            # Ambiguous keys try both directions, with the same shared mappings
+            for from_side in ('L', 'R'):
+                if from_side not in side_mappings:
+                    side_mappings[from_side] = create_vertex_mirror_mapping(
+                        basis_coords, from_side, left_vertices, right_vertices, tolerance)
+            source_vertices_l, target_vertices_l, src_indices_l, tgt_indices_l = side_mappings['L']
+            source_vertices_r, target_vertices_r, src_indices_r, tgt_indices_r = side_mappings['R']
             
+            # Scratch buffers reused by every ambiguous key (each key is mirrored before the next is read)
+            key_coords = np.empty_like(basis_coords)
+            displacement = np.empty_like(basis_coords)
+            displacement_sq = np.empty(len(basis_coords), dtype=np.float32)
+        
         # Handle the ambiguous keys (no clear L/R designation)
         for key in ambiguous_keys:
             # For ambiguous keys, we'll try both L->R and R->L mappings
             # and use the one that produces more significant deformation
             
             # Skip keys that seem to be mirrors we just created
-            if any(mirror_name == key.name for _, mirror_name in mirrored_keys):
+            if key.name in created_names:
                 skipped_keys.append(key.name)
                 continue
             
@@ -242,64 +264,43 @@ class SHAPEKEY_OT_mirror_all_missing(Operator):
             test_l_to_r_info = {'from_side': 'L', 'to_side': 'R', 'base_name': key.name}
             test_r_to_l_info = {'from_side': 'R', 'to_side': 'L', 'base_name': key.name}
             
-            # L->R mapping
-            source_vertices_l, target_vertices_l, mirror_map_l, reverse_map_l = create_vertex_mirror_mapping(
-                basis_key, 'L', left_vertices, right_vertices, center_vertices, tolerance)
-                
-            # R->L mapping
-            source_vertices_r, target_vertices_r, mirror_map_r, reverse_map_r = create_vertex_mirror_mapping(
-                basis_key, 'R', left_vertices, right_vertices, center_vertices, tolerance)
-            
-            # Count deformation on both sides
-            l_side_deformation = 0
-            r_side_deformation = 0
-            
-            # Check L side deformation (vertices affecting R side when mirrored)
-            for tgt_idx in target_vertices_l:
-                src_idx = reverse_map_l.get(tgt_idx)
-                if src_idx is not None:
-                    basis_co = basis_key.data[src_idx].co
-                    active_co = key.data[src_idx].co
-                    displacement = active_co - basis_co
-                    if displacement.length > 0.0001:
-                        l_side_deformation += 1
+            # Find the vertices this key moves from one bulk read of its coordinates
+            get_vertex_coords(key, out=key_coords)
+            np.subtract(key_coords, basis_coords, out=displacement)
+            np.einsum('ij,ij->i', displacement, displacement, out=displacement_sq)
+            moved = displacement_sq > 0.0001 ** 2
             
-            # Check R side deformation (vertices affecting L side when mirrored)
-            for tgt_idx in target_vertices_r:
-                src_idx = reverse_map_r.get(tgt_idx)
-                if src_idx is not None:
-                    basis_co = basis_key.data[src_idx].co
-                    active_co = key.data[src_idx].co
-                    displacement = active_co - basis_co
-                    if displacement.length > 0.0001:
-                        r_side_deformation += 1
+            # Count deformation on both sides: L side vertices affect the R side when mirrored and vice versa
+            l_side_deformation = int(np.count_nonzero(moved[src_indices_l]))
+            r_side_deformation = int(np.count_nonzero(moved[src_indices_r]))
             
             # Choose the side with more deformation
             if l_side_deformation > r_side_deformation:
                 from_side = 'L'
                 pattern_info = test_l_to_r_info
                 target_vertices = target_vertices_l
-                reverse_map = reverse_map_l
+                src_indices, tgt_indices = src_indices_l, tgt_indices_l
             else:
                 from_side = 'R'
                 pattern_info = test_r_to_l_info
                 target_vertices = target_vertices_r
-                reverse_map = reverse_map_r
+                src_indices, tgt_indices = src_indices_r, tgt_indices_r
             
             # Generate name with the detected side
             pattern_info['separator'] = '_'  # Use underscore for ambiguous keys
             new_key_name = f"{key.name}_Mirror_{pattern_info['to_side']}"
             
             # Make sure the name is unique
-            if new_key_name in shape_keys:
+            if new_key_name in existing_names:
                 i = 1
-                while f"{new_key_name}_{i}" in shape_keys:
+                while f"{new_key_name}_{i}" in existing_names:
                     i += 1
                 new_key_name = f"{new_key_name}_{i}"
             
             # Create the mirrored shape key
             new_key, mirrored_count = mirror_shape_key(
-                obj, key, new_key_name, basis_key, target_vertices, reverse_map)
+                obj, key, new_key_name, basis_coords, src_indices, tgt_indices, key_coords, mirror_coords)
+            existing_names.add(new_key_name)
             
             mirrored_keys.append((key.name, new_key_name))
         
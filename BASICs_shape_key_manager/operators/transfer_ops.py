@@ -1,7 +1,56 @@
 import bpy
+import math
 import numpy as np
+from dataclasses import dataclass, field
 from bpy.types import Operator
 
+@dataclass(slots=True)
+class _TransferState:
+    """Source and target state changed by a shape key transfer, restored in one place"""
+    source: bpy.types.Object
+    target: bpy.types.Object
+    mode: str
+    source_hide: bool
+    source_hide_select: bool
+    target_hide: bool
+    target_hide_select: bool
+    key_values: list = field(default_factory=list)   # (source key block, original value)
+    modifiers: list = field(default_factory=list)    # (target modifier, original show_viewport)
+    surface_deform: bpy.types.Modifier = None
+    
+    def restore_visibility(self):
+        """Restore visibility and selectability of both objects"""
+        self.source.hide_set(self.source_hide)
+        self.source.hide_select = self.source_hide_select
+        self.target.hide_set(self.target_hide)
+        self.target.hide_select = self.target_hide_select
+    
+    def restore(self):
+        """Undo every change recorded for the transfer"""
+        # Restore original shape key values on source, skipping keys removed in the meantime
+        # (stale references are only compared, never dereferenced)
+        shape_keys = self.source.data.shape_keys
+        current_keys = set(shape_keys.key_blocks) if shape_keys else set()
+        for key, value in self.key_values:
+            if key in current_keys:
+                key.value = value
+        
+        # Remove the Surface Deform modifier
+        if self.surface_deform is not None:
+            self.target.modifiers.remove(self.surface_deform)
+            self.surface_deform = None
+        
+        # Restore original modifier visibility, one set of the current modifiers instead of name lookups
+        current_modifiers = set(self.target.modifiers)
+        for mod, visible in self.modifiers:
+            if mod in current_modifiers:
+                mod.show_viewport = visible
+        
+        self.restore_visibility()
+        
+        # Return to original mode
+        bpy.ops.object.mode_set(mode=self.mode)
+
 class SHAPEKEY_OT_transfer_with_surface_deform(Operator):
     """Transfer shape keys from source mesh to target mesh using Surface Deform modifier"""
     bl_idname = "shapekey.transfer_with_surface_deform"
@@ -27,24 +76,21 @@ class SHAPEKEY_OT_transfer_with_surface_deform(Operator):
         return False
     
     def calculate_deformation_amount(self, obj, basis_coords, deformed_coords):
-        """Calculate how much the mesh has deformed from basis to deformed state"""
-        if len(basis_coords) != len(deformed_coords):
-            return 0.0
-            
-        # Calculate max displacement across all vertices
-        max_displacement = 0.0
-        total_displacement = 0.0
+        """Calculate how much the mesh has deformed from basis to deformed state
         
-        for i in range(len(basis_coords)):
-            base = basis_coords[i]
-            deformed = deformed_coords[i]
+        basis_coords and deformed_coords are (N, 3) arrays read in bulk by the caller.
+        """
+        deformed_coords = np.asarray(deformed_coords, dtype=np.float32)
+        if len(basis_coords) != len(deformed_coords) or len(basis_coords) == 0:
+            return 0.0, 0.0
             
-            # Calculate distance between base and deformed positions
-            displacement = np.linalg.norm(np.array(deformed) - np.array(base))
-            max_displacement = max(max_displacement, displacement)
-            total_displacement += displacement
-            
-        avg_displacement = total_displacement / len(basis_coords) if basis_coords else 0
+        # Squared distance between base and deformed positions for every vertex at once
+        diff = deformed_coords - basis_coords
+        squared = np.einsum('ij,ij->i', diff, diff)
+        
+        # The maximum only needs one square root, the mean needs them all (done in place)
+        max_displacement = math.sqrt(squared.max())
+        avg_displacement = float(np.sqrt(squared, out=squared).mean())
         
         return max_displacement, avg_displacement
     
@@ -59,10 +105,7 @@ class SHAPEKEY_OT_transfer_with_surface_deform(Operator):
         source = sources[0]  # Use the first valid source
         
         # Get the transfer settings from the scene properties
-        strength = context.scene.shapekey_transfer_strength
         clear_existing = context.scene.shapekey_transfer_clear_existing
-        skip_minimal_effect = context.scene.shapekey_transfer_skip_minimal
-        deformation_threshold = context.scene.shapekey_transfer_threshold
         
         # Clear existing shape keys if needed
         if clear_existing and target.data.shape_keys:
@@ -78,29 +121,57 @@ class SHAPEKEY_OT_transfer_with_surface_deform(Operator):
             basis = target.shape_key_add(name="Basis")
             basis.interpolation = 'KEY_LINEAR'
         
+        # Snapshot everything the transfer changes on the source and target, restored once at the end
+        state = _TransferState(
+            source=source,
+            target=target,
+            mode=context.object.mode,
+            source_hide=source.hide_get(),
+            source_hide_select=source.hide_select,
+            target_hide=target.hide_get(),
+            target_hide_select=target.hide_select,
+        )
+        try:
+            return self.transfer_shape_keys(context, source, target, state)
+        finally:
+            state.restore()
+    
+    def transfer_shape_keys(self, context, source, target, state):
+        """Bind a Surface Deform modifier to the source and capture every source shape key on the target
+        
+        Source key values, target modifiers, visibility and mode are changed freely here,
+        state.restore() puts them back afterwards.
+        """
+        # Get the transfer settings from the scene properties
+        strength = context.scene.shapekey_transfer_strength
+        skip_minimal_effect = context.scene.shapekey_transfer_skip_minimal
+        deformation_threshold = context.scene.shapekey_transfer_threshold
+        
         # Reset source shape keys to zero
-        stored_values = {}
-        if source.data.shape_keys:
-            for key in source.data.shape_keys.key_blocks:
-                if key.name != 'Basis':
-                    stored_values[key.name] = key.value
-                    key.value = 0.0
-            
-            # Make sure to update the mesh after resetting all keys to zero
-            context.view_layer.update()
+        for key in source.data.shape_keys.key_blocks:
+            if key.name != 'Basis':
+                state.key_values.append((key, key.value))
+                key.value = 0.0
+        
+        # Make sure to update the mesh after resetting all keys to zero
+        context.view_layer.update()
         
-        # Remember original target state
-        original_target_modifiers = []
+        # Remember original target state (modifier references, so restoring needs no name lookups)
         for mod in target.modifiers:
-            original_target_modifiers.append((mod.name, mod.show_viewport))
+            state.modifiers.append((mod, mod.show_viewport))
             # Disable all modifiers to avoid interference
             mod.show_viewport = False
         
         # Store the original vertex positions of the target mesh before any deformation
-        original_coords = [v.co.copy() for v in target.data.vertices]
+        # (built once as an array and reused for every shape key below)
+        vertex_count = len(target.data.vertices)
+        original_coords = np.empty(vertex_count * 3, dtype=np.float32)
+        target.data.vertices.foreach_get("co", original_coords)
+        original_coords = original_coords.reshape(vertex_count, 3)
         
         # Add Surface Deform modifier to target
         surface_deform = target.modifiers.new(name="SurfaceDeform", type='SURFACE_DEFORM')
+        state.surface_deform = surface_deform
         surface_deform.target = source
         surface_deform.show_viewport = True
         
@@ -109,15 +180,9 @@ class SHAPEKEY_OT_transfer_with_surface_deform(Operator):
             target.vertex_groups.remove(vg)
         
         # We need to ensure we're in object mode for this
-        original_mode = context.object.mode
         bpy.ops.object.mode_set(mode='OBJECT')
         
         # Make sure both objects are visible and selectable
-        source_hide = source.hide_get()
-        source_select = source.hide_select
-        target_hide = target.hide_get()
-        target_select = target.hide_select
-        
         source.hide_set(False)
         source.hide_select = False
         target.hide_set(False)
@@ -157,25 +222,10 @@ class SHAPEKEY_OT_transfer_with_surface_deform(Operator):
                 bind_success = False
         
         # Restore visibility and selectability
-        source.hide_set(source_hide)
-        source.hide_select = source_select
-        target.hide_set(target_hide)
-        target.hide_select = target_select
+        state.restore_visibility()
         
-        # If binding failed, clean up and exit
+        # If binding failed, exit (the modifier and the rest of the state are cleaned up by the caller)
         if not bind_success:
-            # Clean up
-            target.modifiers.remove(surface_deform)
-            # Restore modifier visibility
-            for mod_name, mod_visibility in original_target_modifiers:
-                if mod_name in target.modifiers:
-                    target.modifiers[mod_name].show_viewport = mod_visibility
-            # Restore original shape key values on source
-            for key_name, value in stored_values.items():
-                if key_name in source.data.shape_keys.key_blocks:
-                    source.data.shape_keys.key_blocks[key_name].value = value
-            # Return to original mode
-            bpy.ops.object.mode_set(mode=original_mode)
             return {'CANCELLED'}
         
         # Force immediate mesh update to capture binding
@@ -190,36 +240,51 @@ class SHAPEKEY_OT_transfer_with_surface_deform(Operator):
         if target.data.shape_keys:
             basis_key = target.data.shape_keys.key_blocks['Basis']
         
-        for key in source.data.shape_keys.key_blocks:
-            if key.name != 'Basis':
-                # Reset all shape keys to zero first
-                for reset_key in source.data.shape_keys.key_blocks:
-                    if reset_key.name != 'Basis':
-                        reset_key.value = 0.0
-                
-                # Set only this shape key to maximum value
-                key.value = strength
-                
-                # Force update to ensure the modifier has updated the mesh
-                context.view_layer.update()
-                context.view_layer.depsgraph.update()
-                
-                # Evaluate if this shape key causes deformation
-                skip_this_key = False
-                deformed_verts = None
+        # One scratch buffer receives the evaluated coordinates of every shape key in turn
+        # (each key is fully written out before the next one is read)
+        deformed_flat = np.empty(vertex_count * 3, dtype=np.float32)
+        deformed_coords = deformed_flat.reshape(vertex_count, 3)
+        change_flat = np.empty_like(deformed_flat)
+        original_flat = original_coords.ravel()
+        
+        # Source key values, written together for every key (the Basis value is left as it is)
+        key_blocks = source.data.shape_keys.key_blocks
+        reset_values = np.empty(len(key_blocks), dtype=np.float32)
+        key_blocks.foreach_get("value", reset_values)
+        is_basis = np.array([key.name == 'Basis' for key in key_blocks])
+        reset_values[~is_basis] = 0.0
+        key_values = np.empty_like(reset_values)
+        
+        for key_index, key in enumerate(key_blocks):
+            if is_basis[key_index]:
+                continue
+            
+            # Set only this shape key to maximum value and all others to zero in one bulk write
+            key_values[:] = reset_values
+            key_values[key_index] = strength
+            key_blocks.foreach_set("value", key_values)
+            # The bulk write skips the value update callbacks, so tag the source keys by hand
+            source.data.shape_keys.update_tag()
+            
+            # A single update per key lets the modifier update the mesh
+            context.view_layer.update()
+            
+            # Get current deformed vertex coordinates in bulk
+            # We need the actual data from the depsgraph for accurate evaluation
+            depsgraph = context.evaluated_depsgraph_get()
+            evaluated_obj = target.evaluated_get(depsgraph)
+            evaluated_obj.data.vertices.foreach_get("co", deformed_flat)
+            
+            # Evaluate if this shape key causes deformation
+            skip_this_key = False
+            
+            if skip_minimal_effect and vertex_count:
+                # The largest change along a single axis is a lower bound of the largest
+                # displacement, so keys that clearly deform need no distance calculation
+                np.subtract(deformed_flat, original_flat, out=change_flat)
+                max_axis_change = float(np.abs(change_flat, out=change_flat).max())
                 
-                if skip_minimal_effect:
-                    # Get current deformed vertex coordinates
-                    # We need the actual data from the depsgraph for accurate evaluation
-                    depsgraph = context.evaluated_depsgraph_get()
-                    evaluated_obj = target.evaluated_get(depsgraph)
-                    
-                    # Get deformed coordinates
-                    deformed_coords = [evaluated_obj.data.vertices[i].co.copy() for i in range(len(target.data.vertices))]
-                    
-                    # Store for later use
-                    deformed_verts = deformed_coords
-                    
+                if max_axis_change < deformation_threshold:
                     # Calculate deformation metrics against original coordinates
                     max_displacement, avg_displacement = self.calculate_deformation_amount(
                         target, original_coords, deformed_coords)
@@ -227,51 +292,22 @@ class SHAPEKEY_OT_transfer_with_surface_deform(Operator):
                     # Skip if below threshold
                     if max_displacement < deformation_threshold:
                         self.report({'INFO'}, f"Skipping shape key {key.name} (max displacement: {max_displacement:.6f})")
-                        key.value = 0.0
                         skipped_count += 1
                         skip_this_key = True
-                else:
-                    # Get the deformed vertices for capture
-                    depsgraph = context.evaluated_depsgraph_get()
-                    evaluated_obj = target.evaluated_get(depsgraph)
-                    deformed_verts = [evaluated_obj.data.vertices[i].co.copy() for i in range(len(target.data.vertices))]
+            
+            if not skip_this_key:
+                # Use direct mesh data manipulation for more reliable shape key creation
+                # First create a new shape key
+                new_key = target.shape_key_add(name=f"temp_{key.name}")
+                new_key.interpolation = 'KEY_LINEAR'
                 
-                if not skip_this_key:
-                    # Use direct mesh data manipulation for more reliable shape key creation
-                    # First create a new shape key
-                    new_key = target.shape_key_add(name=f"temp_{key.name}")
-                    new_key.interpolation = 'KEY_LINEAR'
-                    
-                    # Then manually set its vertex positions from the evaluated mesh
-                    for i, co in enumerate(deformed_verts):
-                        new_key.data[i].co = co
-                    
-                    # Rename to match source
-                    new_key.name = key.name
-                    
-                    transferred_count += 1
+                # Then set its vertex positions from the evaluated mesh in one bulk write
+                new_key.data.foreach_set("co", deformed_flat)
                 
-                # Reset source shape key value
-                key.value = 0.0
+                # Rename to match source
+                new_key.name = key.name
                 
-                # Force update again
-                context.view_layer.update()
-        
-        # Restore original shape key values on source
-        for key_name, value in stored_values.items():
-            if key_name in source.data.shape_keys.key_blocks:
-                source.data.shape_keys.key_blocks[key_name].value = value
-        
-        # Remove the Surface Deform modifier
-        target.modifiers.remove(surface_deform)
-        
-        # Restore original modifier visibility
-        for mod_name, mod_visibility in original_target_modifiers:
-            if mod_name in target.modifiers:
-                target.modifiers[mod_name].show_viewport = mod_visibility
-        
-        # Return to original mode
-        bpy.ops.object.mode_set(mode=original_mode)
+                transferred_count += 1
         
         if skipped_count > 0:
             self.report({'INFO'}, f"Transferred {transferred_count} shape keys from {source.name} to {target.name} (skipped {skipped_count} with minimal effect)")
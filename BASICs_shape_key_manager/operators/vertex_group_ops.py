@@ -1,4 +1,5 @@
 import bpy
+import numpy as np
 from bpy.types import Operator
 from bpy.props import StringProperty, BoolProperty
 
@@ -53,33 +54,36 @@ class VERTEXGROUP_OT_combine_groups(Operator):
         # Create a new vertex group
         new_group = obj.vertex_groups.new(name=self.new_group_name)
         
-        # Dictionary to store combined weights for each vertex
-        combined_weights = {}
-        
-        # Iterate through all vertices
+        # Collect the memberships in the selected groups in one pass over the vertices
+        # (reading each group per vertex would raise for every vertex outside it)
+        group_indices = {vg.index for vg in groups_to_combine}
+        member_vertices = []
+        member_weights = []
         for v in obj.data.vertices:
-            vertex_idx = v.index
-            total_weight = 0.0
-            
-            # Sum weights from all selected groups
-            for vg in groups_to_combine:
-                try:
-                    weight = vg.weight(vertex_idx)
-                    total_weight += weight
-                except RuntimeError:
-                    # Vertex not in this group
-                    pass
-            
-            # Store the combined weight if it's greater than zero
-            if total_weight > 0:
-                combined_weights[vertex_idx] = total_weight
+            for g in v.groups:
+                if g.group in group_indices:
+                    member_vertices.append(v.index)
+                    member_weights.append(g.weight)
         
-        # Apply the combined weights to the new vertex group
-        for vertex_idx, weight in combined_weights.items():
+        if member_vertices:
+            # Sum the weights of each vertex over all selected groups
+            combined_weights = np.bincount(
+                np.asarray(member_vertices, dtype=np.int64), weights=member_weights,
+                minlength=len(obj.data.vertices))
+            
             # Normalize if requested
-            if self.normalize_weights and weight > 1.0:
-                weight = 1.0
-            new_group.add([vertex_idx], weight, 'REPLACE')
+            if self.normalize_weights:
+                np.minimum(combined_weights, 1.0, out=combined_weights)
+            
+            # Group the vertices by weight in one sort and add each group with a single call
+            weighted_vertices = np.flatnonzero(combined_weights > 0)
+            unique_weights, weight_ids = np.unique(
+                combined_weights[weighted_vertices], return_inverse=True)
+            order = np.argsort(weight_ids, kind='stable')
+            splits = np.flatnonzero(np.diff(weight_ids[order])) + 1
+            for weight, vertices in zip(unique_weights.tolist(),
+                                        np.split(weighted_vertices[order], splits)):
+                new_group.add(vertices.tolist(), weight, 'REPLACE')
         
         self.report({'INFO'}, f"Created new vertex group '{self.new_group_name}' from {len(groups_to_combine)} groups")
         return {'FINISHED'}
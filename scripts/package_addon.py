@@ -31,24 +31,25 @@ def get_blender_addons_path(blender_version):
     
     return addon_path
 
-def create_zip(source_dir, output_file):
+def create_zip(source_dir, output_file, verbose=False):
     """Create a zip file from a directory."""
     print(f"Creating zip file: {output_file}")
     
-    with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # Walk through the directory
-        for root, _, files in os.walk(source_dir):
-            for file in files:
-                # Calculate path for file in zip
-                file_path = os.path.join(root, file)
-                
-                # Calculate the relative path (we don't want the full path in the zip)
-                rel_path = os.path.relpath(file_path, os.path.dirname(source_dir))
-                
-                # Add file to zip
-                zipf.write(file_path, rel_path)
+    # Collect every file with its path inside the zip first (we don't want the full path in the zip)
+    archive_root = os.path.dirname(source_dir)
+    entries = [
+        (file_path, os.path.relpath(file_path, archive_root))
+        for root, _, files in os.walk(source_dir)
+        for file_path in (os.path.join(root, file) for file in files)
+    ]
+    
+    with zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=6) as zipf:
+        for file_path, rel_path in entries:
+            zipf.write(file_path, rel_path)
+            if verbose:
                 print(f"Added: {rel_path}")
     
+    print(f"Added {len(entries)} files")
     return output_file
 
 def install_to_blender(zip_file, blender_version, blender_executable=None):
@@ -102,6 +103,7 @@ def main():
     parser.add_argument('--install', action='store_true', help='Install the addon to Blender')
     parser.add_argument('--blender-version', type=str, help='Blender version (e.g., 4.3)')
     parser.add_argument('--blender-exe', type=str, help='Path to Blender executable (optional, for auto-enabling)')
+    parser.add_argument('--verbose', action='store_true', help='List every file added to the zip')
     
     args = parser.parse_args()
     
@@ -120,7 +122,7 @@ def main():
         return 1
     
     # Create the zip file
-    zip_file = create_zip(source_dir, output_file)
+    zip_file = create_zip(source_dir, output_file, args.verbose)
     print(f"Zip file created: {output_file}")
     
     # Install to Blender if requested